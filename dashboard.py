@@ -17,32 +17,47 @@ def main():
 
     # --- Load Data ---
     # This uses the function from our data.py module
-    df = data.load_data()
+    df, country_long = data.load_data()
 
     if not df.empty:
         # --- Create Sidebar and Get Filters ---
         # This uses the function from our ui.py module
-        content_type, selected_countries, year_range = ui.create_sidebar(df)
+        content_type, selected_countries, year_range = ui.create_sidebar(
+            df, country_long
+        )
 
         # --- Filter Data Based on Selections ---
-        filtered_df = df[
-            (df["release_year"] >= year_range[0])
-            & (df["release_year"] <= year_range[1])
-        ]
+        # AND all the filter masks together first so only one filtered copy
+        # of the DataFrame is ever allocated.
+        mask = (df["release_year"] >= year_range[0]) & (
+            df["release_year"] <= year_range[1]
+        )
 
         if content_type != "All":
-            filtered_df = filtered_df[filtered_df["type"] == content_type]
+            mask &= df["type"] == content_type
 
         if selected_countries:
-            filtered_df = filtered_df[
-                filtered_df["country"].apply(
-                    lambda x: any(c in x for c in selected_countries)
-                )
+            # Exact set-membership test against the precomputed long-format
+            # table; a substring scan per row would also match e.g. "India"
+            # inside "Indian Ocean Territory".
+            matching_ids = country_long.loc[
+                country_long["country"].isin(selected_countries), "idx"
             ]
+            mask &= df.index.isin(matching_ids)
+
+        # Slice out only the columns the charts read, so each rerun copies
+        # five narrow columns instead of the whole frame (the country
+        # aggregations go through country_long, keyed by index).
+        chart_columns = ["type", "year_added", "listed_in", "duration_num", "description"]
+        filtered_df = df.loc[mask, chart_columns]
+
+        # A small hashable snapshot of the filter state, used as a cache
+        # key for the expensive renders (e.g. the word cloud).
+        filters_key = (content_type, tuple(sorted(selected_countries)), year_range)
 
         # --- Create Main Page Layout ---
         # This uses the main page function from our ui.py module
-        ui.create_main_page(filtered_df, content_type)
+        ui.create_main_page(filtered_df, country_long, content_type, filters_key)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,20 @@
+import os
+import tempfile
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 
+# Bump this whenever the cleaning/schema below changes so stale Parquet
+# caches are ignored.
+_CACHE_VERSION = 1
+_DF_CACHE = os.path.join(
+    tempfile.gettempdir(), f"netflix_clean_v{_CACHE_VERSION}.parquet"
+)
+_COUNTRY_CACHE = os.path.join(
+    tempfile.gettempdir(), f"netflix_countries_v{_CACHE_VERSION}.parquet"
+)
+
 
 @st.cache_data
 def load_data():
@@ -10,11 +24,40 @@ def load_data():
     improving the app's performance.
 
     Returns:
-        pandas.DataFrame: The cleaned and preprocessed Netflix data.
+        tuple: (df, country_long) where df is the cleaned Netflix data and
+        country_long is a long-format DataFrame with one row per
+        (title index, country) pair, for fast country aggregations.
     """
     url = "https://raw.githubusercontent.com/rfordatascience/tidytuesday/master/data/2021/2021-04-20/netflix_titles.csv"
     try:
-        df = pd.read_csv(url)
+        # Cold starts load the cleaned frames from local Parquet when
+        # available, skipping the CSV download and cleaning entirely.
+        if os.path.exists(_DF_CACHE) and os.path.exists(_COUNTRY_CACHE):
+            return pd.read_parquet(_DF_CACHE), pd.read_parquet(_COUNTRY_CACHE)
+
+        # The multithreaded pyarrow reader parses only the columns the
+        # dashboard uses, with categorical / narrow dtypes applied at read
+        # time instead of in a second pass.
+        df = pd.read_csv(
+            url,
+            engine="pyarrow",
+            usecols=[
+                "type",
+                "title",
+                "country",
+                "date_added",
+                "release_year",
+                "rating",
+                "duration",
+                "listed_in",
+                "description",
+            ],
+            dtype={
+                "type": "category",
+                "rating": "category",
+                "release_year": "int16",
+            },
+        )
 
         # --- Data Cleaning and Preprocessing ---
         # Convert 'date_added' to datetime objects, coercing errors
@@ -27,10 +70,47 @@ def load_data():
         )
 
         # Ensure correct data types for numeric columns
-        df["release_year"] = df["release_year"].astype(int)
         df["year_added"] = df["year_added"].astype(int)
 
-        return df
+        # Pull the number out of 'duration' ("90 min" / "2 Seasons") once,
+        # so the histogram does a pure numeric filter instead of running
+        # the regex engine on every rerun. float32 keeps NaNs for rows
+        # without a duration while halving the bandwidth of float64.
+        df["duration_num"] = (
+            df["duration"].str.extract(r"(\d+)")[0].astype("float32")
+        )
+
+        # Split the multi-country column once, up front. Downstream charts
+        # aggregate on this long-format table instead of re-running
+        # str.split().explode() on every Streamlit rerun. np.fromiter
+        # builds the flat token array in one preallocated pass, skipping
+        # the per-row list Series that Series.str.split would construct.
+        arr = df["country"].to_numpy()
+        counts = np.fromiter(
+            (s.count(", ") + 1 for s in arr), dtype=np.int64, count=len(arr)
+        )
+        flat = np.fromiter(
+            (c for s in arr for c in s.split(", ")),
+            dtype=object,
+            count=counts.sum(),
+        )
+        country_long = pd.DataFrame(
+            {
+                "idx": np.repeat(df.index.to_numpy(), counts),
+                "country": pd.Categorical(flat),
+            }
+        )
+
+        # Best-effort write-through cache; Parquet keeps the categorical
+        # dtypes, so the next start skips the cleaning work too.
+        try:
+            df.to_parquet(_DF_CACHE, compression="zstd")
+            country_long.to_parquet(_COUNTRY_CACHE, compression="zstd")
+        except OSError:
+            pass
+
+        return df, country_long
     except Exception as e:
         st.error(f"Error loading or processing data: {e}")
-        return pd.DataFrame()  # Return an empty DataFrame on error
+        # Return empty frames on error
+        return pd.DataFrame(), pd.DataFrame(columns=["idx", "country"])
@@ -1,11 +1,14 @@
+import functools
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 import pycountry
 
 
+@functools.lru_cache(maxsize=None)
 def get_iso_alpha(country_name):
     """Converts country name to ISO 3166-1 alpha-3 code."""
     country_map = {
@@ -27,29 +30,57 @@ def get_iso_alpha(country_name):
             return None
 
 
-def create_sidebar(df):
-    """Creates the sidebar with all the interactive filters."""
+@st.cache_data
+def _iso_map(countries):
+    """
+    Builds a {country name: ISO alpha-3 code} lookup once for the full set
+    of countries. pycountry lookups (especially search_fuzzy misses) are
+    slow, so this runs once rather than per map render.
+    """
+    return {c: get_iso_alpha(c) for c in countries}
+
+
+@st.cache_data
+def _country_options(country_long):
+    """Returns the sorted list of unique country names, computed once."""
+    return sorted(country_long["country"].cat.categories.tolist())
+
+
+@st.cache_data
+def _year_bounds(df):
+    """Returns the (min, max) release years, computed once."""
+    return int(df["release_year"].min()), int(df["release_year"].max())
+
+
+def create_sidebar(df, country_long):
+    """
+    Creates the sidebar with all the interactive filters.
+
+    The widgets live inside a form, so the app reruns once per 'Apply'
+    click instead of on every slider tick or multiselect change.
+    """
     st.sidebar.header("Dashboard Filters")
-    content_type = st.sidebar.selectbox(
-        "Select Content Type:", options=["All", "Movie", "TV Show"], index=0
-    )
-    all_countries = sorted(df["country"].str.split(", ").explode().unique())
-    selected_countries = st.sidebar.multiselect(
-        "Select Country/Countries:",
-        options=all_countries,
-        default=["United States", "India"],
-    )
-    min_year, max_year = int(df["release_year"].min()), int(df["release_year"].max())
-    year_range = st.sidebar.slider(
-        "Select Release Year Range:",
-        min_value=min_year,
-        max_value=max_year,
-        value=(min_year, max_year),
-    )
+    min_year, max_year = _year_bounds(df)
+    with st.sidebar.form("filters"):
+        content_type = st.selectbox(
+            "Select Content Type:", options=["All", "Movie", "TV Show"], index=0
+        )
+        selected_countries = st.multiselect(
+            "Select Country/Countries:",
+            options=_country_options(country_long),
+            default=["United States", "India"],
+        )
+        year_range = st.slider(
+            "Select Release Year Range:",
+            min_value=min_year,
+            max_value=max_year,
+            value=(min_year, max_year),
+        )
+        st.form_submit_button("Apply Filters")
     return content_type, selected_countries, year_range
 
 
-def create_world_map(filtered_df):
+def create_world_map(filtered_df, country_long):
     """Creates and displays an improved choropleth world map with a solid background."""
     st.subheader("🌎 Global Content Production Hotspots")
     st.markdown(
@@ -59,20 +90,26 @@ def create_world_map(filtered_df):
     )
 
     country_counts = (
-        filtered_df["country"].str.split(", ").explode().value_counts().reset_index()
+        country_long.loc[country_long["idx"].isin(filtered_df.index), "country"]
+        .value_counts()
+        .reset_index()
     )
     country_counts.columns = ["country", "count"]
-    country_counts["iso_alpha"] = country_counts["country"].apply(get_iso_alpha)
+    # value_counts on a categorical reports every category; drop empty ones
+    country_counts = country_counts[country_counts["count"] > 0]
+    iso_map = _iso_map(tuple(country_long["country"].cat.categories))
+    country_counts["iso_alpha"] = country_counts["country"].map(iso_map)
     country_counts = country_counts.dropna(subset=["iso_alpha"])
 
-    fig = px.choropleth(
-        country_counts,
-        locations="iso_alpha",
-        color="count",
-        hover_name="country",
-        hover_data={"iso_alpha": False, "count": True},
-        color_continuous_scale=px.colors.sequential.Reds,
-        projection="natural earth",
+    fig = go.Figure(
+        go.Choropleth(
+            locations=country_counts["iso_alpha"].to_numpy(),
+            z=country_counts["count"].to_numpy(),
+            text=country_counts["country"].astype(str).to_numpy(),
+            hovertemplate="<b>%{text}</b><br>count=%{z}<extra></extra>",
+            colorscale="Reds",
+            colorbar_title="count",
+        )
     )
 
     # --- FIX FOR MAP BACKGROUND ---
@@ -84,6 +121,7 @@ def create_world_map(filtered_df):
     )
     # Explicitly set the ocean color to match the background
     fig.update_geos(
+        projection_type="natural earth",
         showocean=True,
         oceancolor="#0E1117",  # This forces the ocean to have a solid color
         showframe=False,
@@ -93,20 +131,41 @@ def create_world_map(filtered_df):
     st.plotly_chart(fig, use_container_width=True)
 
 
+def create_timeline_chart(filtered_df):
+    """Creates and displays a line chart of titles added to Netflix per year."""
+    st.subheader("Titles Added Over Time")
+    added_by_year = filtered_df["year_added"].value_counts().sort_index()
+    fig = go.Figure(
+        go.Scattergl(
+            x=added_by_year.index.to_numpy(),
+            y=added_by_year.to_numpy(),
+            mode="lines+markers",
+            line=dict(color="#E50914", width=3),
+        )
+    )
+    fig.update_layout(xaxis_title="Year Added", yaxis_title="Number of Titles")
+    st.plotly_chart(fig, use_container_width=True)
+
+
 def create_genre_chart(filtered_df):
     """Creates and displays a bar chart for top genres."""
     st.subheader("Top Content Genres")
     genre_counts = (
         filtered_df["listed_in"].str.split(", ").explode().value_counts().nlargest(15)
     )
-    fig = px.bar(
-        x=genre_counts.values,
-        y=genre_counts.index,
-        orientation="h",
-        labels={"x": "Number of Titles", "y": "Genre"},
-        color_discrete_sequence=["#E50914"],
+    fig = go.Figure(
+        go.Bar(
+            x=genre_counts.to_numpy(),
+            y=genre_counts.index.to_numpy(),
+            orientation="h",
+            marker_color="#E50914",
+        )
+    )
+    fig.update_layout(
+        xaxis_title="Number of Titles",
+        yaxis_title="Genre",
+        yaxis={"categoryorder": "total ascending"},
     )
-    fig.update_layout(yaxis={"categoryorder": "total ascending"})
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -120,108 +179,153 @@ def create_duration_histogram(filtered_df, content_type):
         )
 
     if analysis_type == "Movie":
-        movie_durations = (
-            filtered_df[filtered_df["type"] == "Movie"]["duration"]
-            .str.extract(r"(\d+)")
-            .astype(float)
+        movie_durations = filtered_df.loc[
+            filtered_df["type"] == "Movie", "duration_num"
+        ]
+        # Bin server-side so only 30 bars are serialized to the browser,
+        # not every individual runtime.
+        counts, edges = np.histogram(movie_durations.dropna().to_numpy(), bins=30)
+        fig = go.Figure(
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                marker_color="#E50914",
+            )
         )
-        fig = px.histogram(
-            movie_durations,
-            x=0,
-            nbins=30,
+        fig.update_layout(
             title="Distribution of Movie Runtimes (in minutes)",
-            labels={"0": "Runtime (minutes)"},
-            color_discrete_sequence=["#E50914"],
+            xaxis_title="Runtime (minutes)",
+            yaxis_title="Count",
+            bargap=0,
         )
         st.plotly_chart(fig, use_container_width=True)
 
     elif analysis_type == "TV Show":
-        tv_seasons = (
-            filtered_df[filtered_df["type"] == "TV Show"]["duration"]
-            .str.extract(r"(\d+)")
-            .astype(float)
+        tv_seasons = filtered_df.loc[
+            filtered_df["type"] == "TV Show", "duration_num"
+        ]
+        season_counts = tv_seasons.value_counts().sort_index()
+        fig = go.Figure(
+            go.Bar(
+                x=season_counts.index.to_numpy(),
+                y=season_counts.to_numpy(),
+                marker_color="#E50914",
+            )
         )
-        season_counts = tv_seasons[0].value_counts().sort_index()
-        fig = px.bar(
-            x=season_counts.index,
-            y=season_counts.values,
+        fig.update_layout(
             title="Distribution of TV Show Seasons",
-            labels={"x": "Number of Seasons", "y": "Number of TV Shows"},
-            color_discrete_sequence=["#E50914"],
+            xaxis_title="Number of Seasons",
+            yaxis_title="Number of TV Shows",
         )
         st.plotly_chart(fig, use_container_width=True)
 
 
-def create_description_wordcloud(filtered_df):
+@st.cache_data
+def _build_wordcloud(filters_key, _text):
+    """
+    Generates the word cloud image as a numpy array, cached per filter
+    state. The text itself is excluded from hashing (underscore prefix);
+    the small filters_key tuple identifies it.
+    """
+    wordcloud = WordCloud(
+        background_color="white", width=800, height=400, colormap="Reds"
+    ).generate(_text)
+    return wordcloud.to_array()
+
+
+def create_description_wordcloud(filtered_df, filters_key):
     """Creates and displays a word cloud from content descriptions."""
     st.subheader("Common Words in Descriptions")
     if not filtered_df.empty and "description" in filtered_df.columns:
-        text = " ".join(desc for desc in filtered_df["description"].dropna())
+        # .tolist() hands str.join a plain list in one C-level step, the
+        # fastest concatenation path; a generator feeds it item by item.
+        text = " ".join(filtered_df["description"].dropna().to_numpy().tolist())
         if text:
-            wordcloud = WordCloud(
-                background_color="white", width=800, height=400, colormap="Reds"
-            ).generate(text)
-            fig, ax = plt.subplots()
-            ax.imshow(wordcloud, interpolation="bilinear")
-            ax.axis("off")
-            st.pyplot(fig)
+            wordcloud_array = _build_wordcloud(filters_key, text)
+            st.image(wordcloud_array, use_container_width=True)
         else:
             st.warning("No descriptions available for the selected filters.")
     else:
         st.warning("No data to generate a word cloud.")
 
 
-def create_main_page(filtered_df, content_type):
+def create_main_page(filtered_df, country_long, content_type, filters_key):
     """Creates the main page layout with key metrics and charts."""
     st.title("🎬 Netflix Content Analysis Dashboard")
     st.markdown("An interactive dashboard to explore movies and TV shows on Netflix.")
 
     st.markdown("### 📊 Key Metrics")
+    # One pass over the type column serves all three metrics and the pie.
+    type_counts = filtered_df["type"].value_counts()
     col1, col2, col3 = st.columns(3)
-    col1.metric("Total Titles", f"{filtered_df.shape[0]:,}")
-    col2.metric("Movies", f"{filtered_df[filtered_df['type'] == 'Movie'].shape[0]:,}")
-    col3.metric(
-        "TV Shows", f"{filtered_df[filtered_df['type'] == 'TV Show'].shape[0]:,}"
-    )
+    col1.metric("Total Titles", f"{type_counts.sum():,}")
+    col2.metric("Movies", f"{type_counts.get('Movie', 0):,}")
+    col3.metric("TV Shows", f"{type_counts.get('TV Show', 0):,}")
     st.markdown("---")
 
-    create_world_map(filtered_df)
-    st.markdown("---")
+    # Tabs keep only the active group of charts in the rendered page, so a
+    # filter change repaints one view instead of six stacked figures.
+    overview_tab, map_tab, timeline_tab, genre_tab, duration_tab, words_tab = st.tabs(
+        ["Overview", "World Map", "Timeline", "Genres", "Duration", "Word Cloud"]
+    )
 
-    col1, col2 = st.columns(2)
-    with col1:
-        st.subheader("Content by Type")
-        type_counts = filtered_df["type"].value_counts()
-        fig1 = px.pie(
-            names=type_counts.index,
-            values=type_counts.values,
-            hole=0.3,
-            color_discrete_sequence=["#E50914", "#B3B3B3"],
-        )
-        fig1.update_layout(legend_title_text="Type")
-        st.plotly_chart(fig1, use_container_width=True)
+    with overview_tab:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Content by Type")
+            # Drop zero-count categories so a Movies-only view doesn't
+            # show a "TV Show" legend entry
+            pie_counts = type_counts[type_counts > 0]
+            fig1 = go.Figure(
+                go.Pie(
+                    labels=pie_counts.index.astype(str).to_numpy(),
+                    values=pie_counts.to_numpy(),
+                    hole=0.3,
+                    marker=dict(colors=["#E50914", "#B3B3B3"]),
+                )
+            )
+            fig1.update_layout(legend_title_text="Type")
+            st.plotly_chart(fig1, use_container_width=True)
 
-    with col2:
-        st.subheader("Top Content-Producing Countries")
-        country_counts = (
-            filtered_df["country"].str.split(", ").explode().value_counts().nlargest(10)
-        )
-        fig2 = px.bar(
-            x=country_counts.values,
-            y=country_counts.index,
-            orientation="h",
-            labels={"x": "Number of Titles", "y": "Country"},
-            color_discrete_sequence=["#E50914"],
-        )
-        fig2.update_layout(yaxis={"categoryorder": "total ascending"})
-        st.plotly_chart(fig2, use_container_width=True)
+        with col2:
+            st.subheader("Top Content-Producing Countries")
+            # value_counts on a categorical reports every category; drop
+            # empty ones so nlargest never pads with zero-count countries
+            country_counts = (
+                country_long.loc[
+                    country_long["idx"].isin(filtered_df.index), "country"
+                ]
+                .value_counts()
+                .loc[lambda s: s > 0]
+                .nlargest(10)
+            )
+            fig2 = go.Figure(
+                go.Bar(
+                    x=country_counts.to_numpy(),
+                    y=country_counts.index.astype(str).to_numpy(),
+                    orientation="h",
+                    marker_color="#E50914",
+                )
+            )
+            fig2.update_layout(
+                xaxis_title="Number of Titles",
+                yaxis_title="Country",
+                yaxis={"categoryorder": "total ascending"},
+            )
+            st.plotly_chart(fig2, use_container_width=True)
 
-    st.markdown("---")
-    create_genre_chart(filtered_df)
+    with map_tab:
+        create_world_map(filtered_df, country_long)
 
-    st.markdown("---")
-    col1, col2 = st.columns(2)
-    with col1:
+    with timeline_tab:
+        create_timeline_chart(filtered_df)
+
+    with genre_tab:
+        create_genre_chart(filtered_df)
+
+    with duration_tab:
         create_duration_histogram(filtered_df, content_type)
-    with col2:
-        create_description_wordcloud(filtered_df)
+
+    with words_tab:
+        create_description_wordcloud(filtered_df, filters_key)